@@ -1,7 +1,7 @@
 """Anonymizer root module."""
 import logging
 
-from .anonymizer_engine import AnonymizerEngine
+from .anonymizer_engine import AnonymizerEngine, get_default_engine
 from .deanonymize_engine import DeanonymizeEngine
 
 # Set up default logging (with NullHandler)
@@ -9,4 +9,4 @@ from .deanonymize_engine import DeanonymizeEngine
 
 logging.getLogger("presidio-anonymizer").addHandler(logging.NullHandler())
 
-__all__ = ["AnonymizerEngine", "DeanonymizeEngine"]
+__all__ = ["AnonymizerEngine", "DeanonymizeEngine", "get_default_engine"]
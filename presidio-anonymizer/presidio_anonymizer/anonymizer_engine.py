@@ -1,5 +1,6 @@
 """Handles the entire logic of the Presidio-anonymizer and text anonymizing."""
 import logging
+from functools import lru_cache
 from typing import List, Dict, Optional
 
 from presidio_anonymizer.core.engine_base import EngineBase
@@ -23,6 +24,7 @@ class AnonymizerEngine(EngineBase):
 
     def __init__(self):
         EngineBase.__init__(self)
+        self._anonymizer_names = tuple(self.operators_factory.get_anonymizers())
 
     def anonymize(
             self,
@@ -78,8 +80,7 @@ class AnonymizerEngine(EngineBase):
 
     def get_anonymizers(self) -> List[str]:
         """Return a list of supported anonymizers."""
-        names = [p for p in self.operators_factory.get_anonymizers().keys()]
-        return names
+        return list(self._anonymizer_names)
 
     @staticmethod
     def __is_result_conflicted_with_other_elements(other_elements, result):
@@ -96,3 +97,15 @@ class AnonymizerEngine(EngineBase):
         if not operators.get("DEFAULT"):
             operators["DEFAULT"] = default_operator
         return operators
+
+
+@lru_cache(maxsize=1)
+def get_default_engine() -> AnonymizerEngine:
+    """
+    Return an AnonymizerEngine shared by the whole process.
+
+    Building the engine walks the operators registry, which does not change
+    between requests. The engine keeps no per-request state and its operators
+    are stateless, so the shared instance can be used from several threads.
+    """
+    return AnonymizerEngine()
@@ -35,19 +35,31 @@ class EngineBase(ABC):
         text_replace_builder = TextReplaceBuilder(original_text=text)
         engine_result = EngineResult()
         sorted_pii_entities = sorted(pii_entities, reverse=True)
-        for operator in sorted_pii_entities:
-            text_to_operate_on = text_replace_builder.get_text_in_position(
-                operator.start, operator.end
-            )
+        # Resolve the operator config of each entity once, for both passes.
+        entities_operator_metadata = [
+            self.__get_entity_operator_metadata(entity.entity_type, operators_metadata)
+            for entity in sorted_pii_entities
+        ]
+        batched_texts = self.__operate_in_batches(
+            text_replace_builder, sorted_pii_entities, entities_operator_metadata,
+            operator_type
+        )
+        for index, (operator, operator_metadata) in enumerate(
+                zip(sorted_pii_entities, entities_operator_metadata)):
+            if index in batched_texts:
+                changed_text = batched_texts[index]
+            else:
+                text_to_operate_on = text_replace_builder.get_text_in_position(
+                    operator.start, operator.end
+                )
 
-            self.logger.debug(
-                f"performing operation {operator}"
-            )
-            operator_metadata = self.__get_entity_operator_metadata(
-                operator.entity_type, operators_metadata)
-            changed_text = self.__operate_on_text(
-                operator, text_to_operate_on, operator_metadata, operator_type
-            )
+                self.logger.debug(
+                    f"performing operation {operator}"
+                )
+                changed_text = self.__operate_on_texts(
+                    operator.entity_type, [text_to_operate_on], operator_metadata,
+                    operator_type
+                )[0]
             index_from_end = text_replace_builder.replace_text_get_insertion_index(
                 changed_text, operator.start, operator.end
             )
@@ -65,13 +77,55 @@ class EngineBase(ABC):
         engine_result.normalize_item_indexes()
         return engine_result
 
-    def __operate_on_text(
+    def __operate_in_batches(
+            self,
+            text_replace_builder: TextReplaceBuilder,
+            sorted_pii_entities: List[PIIEntity],
+            entities_operator_metadata: List[OperatorConfig],
+            operator_type: OperatorType
+    ) -> Dict[int, str]:
+        """
+        Operate on the entities whose text is not changed by other replacements.
+
+        Entities sharing the same operator config and entity type are handed to
+        their operator in a single batch.
+        :return: the operated text of each batched entity by its sorted index.
+        """
+        batches = {}
+        last_start = text_replace_builder.text_len
+        for index, (entity, operator_metadata) in enumerate(
+                zip(sorted_pii_entities, entities_operator_metadata)):
+            # Entities are replaced from the end of the text backwards, so the
+            # text of an entity is final only if it ends before every
+            # entity replaced ahead of it.
+            if entity.end <= last_start:
+                batch = batches.setdefault(
+                    (id(operator_metadata), entity.entity_type),
+                    (operator_metadata, entity.entity_type, [], []),
+                )
+                batch[2].append(index)
+                batch[3].append(text_replace_builder.get_text_in_position(
+                    entity.start, entity.end
+                ))
+            last_start = min(last_start, entity.start)
+
+        batched_texts = {}
+        for operator_metadata, entity_type, indexes, texts in batches.values():
+            self.logger.debug(
+                f"performing operation on {len(texts)} {entity_type} entities"
+            )
+            changed_texts = self.__operate_on_texts(
+                entity_type, texts, operator_metadata, operator_type
+            )
+            batched_texts.update(zip(indexes, changed_texts))
+        return batched_texts
+
+    def __operate_on_texts(
             self,
-            text_metadata: PIIEntity,
-            text_to_operate_on: str,
+            entity_type: str,
+            texts_to_operate_on: List[str],
             operator_metadata: OperatorConfig, operator_type: OperatorType
-    ) -> str:
-        entity_type = text_metadata.entity_type
+    ) -> List[str]:
         self.logger.debug(f"getting operator for {entity_type}")
         operator = self.operators_factory.create_operator_class(
             operator_metadata.operator_name, operator_type)
@@ -80,8 +134,7 @@ class EngineBase(ABC):
         params = operator_metadata.params
         params["entity_type"] = entity_type
         self.logger.debug(f"operating on {entity_type} with {operator}")
-        operated_on_text = operator.operate(params=params, text=text_to_operate_on)
-        return operated_on_text
+        return operator.operate_batch(params=params, texts=texts_to_operate_on)
 
     @staticmethod
     def __get_entity_operator_metadata(
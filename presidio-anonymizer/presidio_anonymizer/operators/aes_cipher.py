@@ -1,24 +1,45 @@
 import base64
+import binascii
+from typing import List
 
 from Crypto import Random
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
+from Crypto.Util.strxor import strxor
+
+_VALID_KEY_LENGTHS = frozenset(AES.key_size)
 
 
 class AESCipher:
-    """Advanced Encryption Standard (aka Rijndael) en/decryption in CBC mode."""
+    """Advanced Encryption Standard (aka Rijndael) en/decryption in CBC or CTR mode."""
+
+    MODE_CBC = "CBC"
+    MODE_CTR = "CTR"
+    MODES = [MODE_CBC, MODE_CTR]
+
+    # CTR payloads start with a random 96 bits nonce, leaving a 32 bits block
+    # counter. A shorter random nonce is likely to repeat under the same key,
+    # which would reuse the keystream.
+    CTR_NONCE_SIZE = 12
 
     @staticmethod
-    def encrypt(key: bytes, text: str) -> str:
+    def encrypt(key: bytes, text: str, mode: str = MODE_CBC) -> str:
         """
-        Encrypts a text using AES cypher in CBC mode.
+        Encrypts a text using AES cypher in CBC or CTR mode.
 
-        Uses padding and random IV.
+        CBC mode uses padding and random IV, CTR mode uses a random nonce and
+        no padding.
         :param key: AES encryption key in bytes.
         :param text: The text for encryption.
+        :param mode: The AES mode of operation, either CBC or CTR.
         :returns: The encrypted text.
         """
         encoded_text = text.encode("utf-8")
+        if mode == AESCipher.MODE_CTR:
+            nonce = Random.new().read(AESCipher.CTR_NONCE_SIZE)
+            cipher = AES.new(key, AES.MODE_CTR, nonce=nonce)
+            encrypted_text = base64.b64encode(nonce + cipher.encrypt(encoded_text))
+            return encrypted_text.decode()
         padded_text = pad(encoded_text, AES.block_size)
         iv = Random.new().read(AES.block_size)
         cipher = AES.new(key, AES.MODE_CBC, iv)
@@ -26,21 +47,58 @@ class AESCipher:
         return encrypted_text.decode()
 
     @staticmethod
-    def decrypt(key: bytes, text: str) -> str:
+    def decrypt(key: bytes, text: str, mode: str = MODE_CBC) -> str:
         """
-        Decrypts a previously AES-CBC encrypted text.
+        Decrypts a previously AES-CBC or AES-CTR encrypted text.
 
         :param key: AES encryption key in bytes.
         :param text: The text for decryption.
+        :param mode: The AES mode the text was encrypted with, either CBC or CTR.
         :returns: The decrypted text.
         """
-        decoded_text = base64.b64decode(text)
-        iv = decoded_text[: AES.block_size]
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        decrypted_text = unpad(
-            cipher.decrypt(decoded_text[AES.block_size:]), AES.block_size
-        )
-        return decrypted_text.decode("utf-8")
+        return AESCipher.decrypt_many(key, [text], mode)[0]
+
+    @staticmethod
+    def decrypt_many(key: bytes, texts: List[str],
+                     mode: str = MODE_CBC) -> List[str]:
+        """
+        Decrypts several previously AES encrypted texts with the same key.
+
+        In CBC mode, the ciphertexts of all the texts are deciphered in a
+        single call.
+        :param key: AES encryption key in bytes.
+        :param texts: The texts for decryption.
+        :param mode: The AES mode the texts were encrypted with, either CBC or CTR.
+        :returns: The decrypted texts, in the same order.
+        """
+        # a2b_base64 is what base64.b64decode calls after coercing its input,
+        # which it accepts as is for ASCII strings.
+        payloads = [binascii.a2b_base64(text) for text in texts]
+        if mode == AESCipher.MODE_CTR:
+            return [
+                AESCipher.__decrypt_ctr_payload(key, payload).decode("utf-8")
+                for payload in payloads
+            ]
+        for payload in payloads:
+            if len(payload) % AES.block_size:
+                raise ValueError(
+                    "Data must be padded to 16 byte boundary in CBC mode"
+                )
+            if len(payload) < 2 * AES.block_size:
+                raise ValueError(
+                    "Data must hold an IV and at least one block in CBC mode"
+                )
+        decrypted_blocks = AESCipher.__decrypt_cbc_payloads(key, payloads)
+        decrypted_texts = []
+        offset = 0
+        for payload in payloads:
+            length = len(payload) - AES.block_size
+            decrypted_text = unpad(
+                decrypted_blocks[offset: offset + length], AES.block_size
+            )
+            decrypted_texts.append(decrypted_text.decode("utf-8"))
+            offset += length
+        return decrypted_texts
 
     @staticmethod
     def is_valid_key_size(key: bytes) -> bool:
@@ -50,4 +108,25 @@ class AESCipher:
         :param key: AES encryption key in bytes.
         :returns: True if the key is of valid size, False otherwise.
         """
-        return len(key) in AES.key_size
+        return len(key) in _VALID_KEY_LENGTHS
+
+    @staticmethod
+    def __decrypt_cbc_payloads(key: bytes, payloads: List[bytes]) -> bytes:
+        # CBC decryption of block i is D(C[i]) xor C[i-1] (with C[-1] being
+        # the IV), so each payload (IV + ciphertext) without its last block
+        # is the xor mask of its ciphertext. The key is expanded once for the
+        # whole batch and is not kept once the batch is decrypted.
+        cipher = AES.new(key, AES.MODE_ECB)
+        decrypted_blocks = cipher.decrypt(
+            b"".join(payload[AES.block_size:] for payload in payloads)
+        )
+        return strxor(
+            decrypted_blocks,
+            b"".join(payload[: -AES.block_size] for payload in payloads),
+        )
+
+    @staticmethod
+    def __decrypt_ctr_payload(key: bytes, payload: bytes) -> bytes:
+        nonce = payload[: AESCipher.CTR_NONCE_SIZE]
+        cipher = AES.new(key, AES.MODE_CTR, nonce=nonce)
+        return cipher.decrypt(payload[AESCipher.CTR_NONCE_SIZE:])
@@ -1,10 +1,13 @@
-from typing import Dict
+from typing import Dict, List
 
 from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.operators import Operator
 from presidio_anonymizer.operators import OperatorType
 from presidio_anonymizer.operators.aes_cipher import AESCipher
-from presidio_anonymizer.services.validators import validate_parameter
+from presidio_anonymizer.services.validators import (
+    validate_parameter,
+    validate_parameter_in_range,
+)
 
 
 class Decrypt(Operator):
@@ -12,6 +15,7 @@ class Decrypt(Operator):
 
     NAME = "decrypt"
     KEY = "key"
+    MODE = "mode"
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
@@ -20,12 +24,30 @@ class Decrypt(Operator):
         :param text: The text for decryption.
         :param params:
             **key* The key supplied by the user for the encryption.
+            **mode* The AES mode of operation, either CBC (default) or CTR.
         :return: The encrypted text
         """
         encoded_key = params.get(self.KEY).encode("utf8")
-        decrypted_text = AESCipher.decrypt(key=encoded_key, text=text)
+        decrypted_text = AESCipher.decrypt(
+            key=encoded_key, text=text, mode=self._get_mode_or_default(params)
+        )
         return decrypted_text
 
+    def operate_batch(self, texts: List[str], params: Dict = None) -> List[str]:
+        """
+        Decrypt several texts encrypted with the same key.
+
+        :param texts: The texts for decryption.
+        :param params:
+            **key* The key supplied by the user for the encryption.
+            **mode* The AES mode of operation, either CBC (default) or CTR.
+        :return: The decrypted texts
+        """
+        encoded_key = params.get(self.KEY).encode("utf8")
+        return AESCipher.decrypt_many(
+            key=encoded_key, texts=texts, mode=self._get_mode_or_default(params)
+        )
+
     def validate(self, params: Dict = None) -> None:
         """
         Validate Decrypt parameters.
@@ -33,14 +55,21 @@ class Decrypt(Operator):
         :param params:
             * *key* The key supplied by the user for the encryption.
                     Should be a string of 128, 192 or 256 bits length.
+            * *mode* The AES mode of operation, either CBC (default) or CTR.
         :raises InvalidParamException in case on an invalid parameter.
         """
         key = params.get(self.KEY)
-        validate_parameter(key, self.KEY, str)
+        # A string key is valid, so the generic validation, which also builds
+        # the error messages, only runs for keys of other types.
+        if type(key) is not str:
+            validate_parameter(key, self.KEY, str)
         if not AESCipher.is_valid_key_size(key.encode("utf8")):
             raise InvalidParamException(
                 f"Invalid input, {self.KEY} must be of length 128, 192 or 256 bits"
             )
+        validate_parameter_in_range(
+            AESCipher.MODES, self._get_mode_or_default(params), self.MODE, str
+        )
 
     def operator_name(self) -> str:
         """Return operator name."""
@@ -49,3 +78,6 @@ class Decrypt(Operator):
     def operator_type(self) -> OperatorType:
         """Return operator type."""
         return OperatorType.Deanonymize
+
+    def _get_mode_or_default(self, params: Dict) -> str:
+        return params.get(self.MODE, AESCipher.MODE_CBC)
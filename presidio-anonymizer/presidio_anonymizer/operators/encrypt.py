@@ -3,13 +3,17 @@ from typing import Dict
 from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.operators import Operator, OperatorType
 from presidio_anonymizer.operators.aes_cipher import AESCipher
-from presidio_anonymizer.services.validators import validate_parameter
+from presidio_anonymizer.services.validators import (
+    validate_parameter,
+    validate_parameter_in_range,
+)
 
 
 class Encrypt(Operator):
     """Anonymizes text to an encrypted form, or it to be restored using decrypted."""
 
     KEY = "key"
+    MODE = "mode"
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
@@ -18,10 +22,13 @@ class Encrypt(Operator):
         :param text: The text for encryption.
         :param params:
             * *key* The key supplied by the user for the encryption.
+            * *mode* The AES mode of operation, either CBC (default) or CTR.
         :return: The encrypted text
         """
         encoded_key = params.get(self.KEY).encode("utf8")
-        encrypted_text = AESCipher.encrypt(encoded_key, text)
+        encrypted_text = AESCipher.encrypt(
+            encoded_key, text, self._get_mode_or_default(params)
+        )
         return encrypted_text
 
     def validate(self, params: Dict = None) -> None:
@@ -31,6 +38,7 @@ class Encrypt(Operator):
         :param params:
             * *key* The key supplied by the user for the encryption.
                     Should be a string of 128, 192 or 256 bits length.
+            * *mode* The AES mode of operation, either CBC (default) or CTR.
         :raises InvalidParamException in case on an invalid parameter.
         """
         key = params.get(self.KEY)
@@ -39,6 +47,9 @@ class Encrypt(Operator):
             raise InvalidParamException(
                 f"Invalid input, {self.KEY} must be of length 128, 192 or 256 bits"
             )
+        validate_parameter_in_range(
+            AESCipher.MODES, self._get_mode_or_default(params), self.MODE, str
+        )
 
     def operator_name(self) -> str:
         """Return operator name."""
@@ -47,3 +58,6 @@ class Encrypt(Operator):
     def operator_type(self) -> OperatorType:
         """Return operator type."""
         return OperatorType.Anonymize
+
+    def _get_mode_or_default(self, params: Dict) -> str:
+        return params.get(self.MODE, AESCipher.MODE_CBC)
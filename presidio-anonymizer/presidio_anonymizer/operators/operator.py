@@ -1,7 +1,7 @@
 """Operator abstraction - each operator should implement this class."""
 from abc import abstractmethod, ABC
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
 
 
 class OperatorType(Enum):
@@ -22,6 +22,15 @@ class Operator(ABC):
         """Operate method to be implemented in each operator."""
         pass
 
+    def operate_batch(self, texts: List[str], params: Dict = None) -> List[str]:
+        """
+        Operate on several texts sharing the same parameters.
+
+        Operators which can process many texts at once more efficiently
+        should override this method.
+        """
+        return [self.operate(text, params) for text in texts]
+
     @abstractmethod
     def validate(self, params: Dict = None) -> None:
         """Validate each operator parameters."""
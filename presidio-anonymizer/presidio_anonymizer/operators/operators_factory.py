@@ -14,16 +14,25 @@ class OperatorsFactory:
 
     def __init__(self):
         self.logger = logging.getLogger("presidio-anonymizer")
+        # A single instance of each operator is reused instead of
+        # instantiating the operator for every entity.
+        self._operators = {}
 
     def create_operator_class(self, operator_name: str,
                               operator_type: OperatorType) -> Operator:
         """
         Extract the operator class from the operators list.
 
+        The operator is instantiated on the first call only, the same instance
+        is returned for every later call on this factory. Operators should
+        therefore keep no per-call state and take everything from the params.
         :param operator_type: Either Anonymize or Decrypt to defer between operators.
         :type operator_name: operator name.
         :return: operator class entity.
         """
+        operator = self._operators.get((operator_type, operator_name))
+        if operator is not None:
+            return operator
         operators_by_type = self.__get_operators_classes().get(operator_type)
         if not operators_by_type:
             self.logger.error(f"No such operator type {operator_type}")
@@ -37,7 +46,9 @@ class OperatorsFactory:
                 f"Invalid operator class '{operator_name}'."
             )
         self.logger.debug(f"applying class {operator_class}")
-        return operator_class()
+        operator = operator_class()
+        self._operators[(operator_type, operator_name)] = operator
+        return operator
 
     @staticmethod
     def __get_operators_classes():
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from presidio_anonymizer import AnonymizerEngine
@@ -29,6 +31,35 @@ def test_given_operator_decrypt_with_valid_params_then_decrypt_text_successfully
     assert decryption.items[0].entity_type == "PERSON"
 
 
+def test_given_several_encrypted_entities_then_all_decrypted_in_one_batch():
+    key = "WmZq4t7w!z%C&F)J"
+    text = "My name is Chloë and my friend is Bob"
+    analyzer_results = [
+        RecognizerResult("PERSON", 11, 16, 0.8),
+        RecognizerResult("PERSON", 34, 37, 0.8),
+    ]
+    anonymized = AnonymizerEngine().anonymize(
+        text, analyzer_results,
+        {"PERSON": OperatorConfig("encrypt", {"key": key})}
+    )
+    encryption_results = [
+        AnonymizerResult(start=item.start, end=item.end, entity_type="PERSON")
+        for item in anonymized.items
+    ]
+
+    with mock.patch.object(Decrypt, "operate_batch",
+                           autospec=True,
+                           side_effect=Decrypt.operate_batch) as mock_batch:
+        decryption = DeanonymizeEngine().deanonymize(
+            anonymized.text, encryption_results,
+            {"DEFAULT": OperatorConfig(Decrypt.NAME, {"key": key})}
+        )
+
+    assert decryption.text == text
+    assert mock_batch.call_count == 1
+    assert sorted(item.text for item in decryption.items) == ["Bob", "Chloë"]
+
+
 def test_given_short_key_then_we_fail():
     text = "My name is S184CMt9Drj7QaKQ21JTrpYzghnboTF9pn/neN8JME0="
     encryption_results = [
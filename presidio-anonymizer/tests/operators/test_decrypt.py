@@ -19,6 +19,23 @@ def test_given_anonymize_then_aes_encrypt_called_and_its_result_is_returned(
     assert anonymized_text == expected_decrypted_text
 
 
+@mock.patch.object(AESCipher, "decrypt_many")
+def test_given_operate_batch_then_aes_decrypt_many_called_once_with_all_texts(
+        mock_decrypt_many,
+):
+    expected_decrypted_texts = ["first", "second"]
+    mock_decrypt_many.return_value = expected_decrypted_texts
+
+    decrypted_texts = Decrypt().operate_batch(
+        texts=["text1", "text2"], params={"key": "key"}
+    )
+
+    assert decrypted_texts == expected_decrypted_texts
+    mock_decrypt_many.assert_called_once_with(
+        key=b"key", texts=["text1", "text2"], mode="CBC"
+    )
+
+
 def test_given_verifying_an_valid_length_key_no_exceptions_raised():
     Decrypt().validate(params={"key": "128bitslengthkey"})
 
@@ -29,3 +46,31 @@ def test_given_verifying_an_invalid_length_key_then_ipe_raised():
             match="Invalid input, key must be of length 128, 192 or 256 bits",
     ):
         Decrypt().validate(params={"key": "key"})
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "key,expected_error",
+    [
+        (None, "Expected parameter key"),
+        (128, "Invalid parameter value for key. Expecting 'string', but got 'number'."),
+    ],
+    # fmt: on
+)
+def test_given_verifying_a_missing_or_non_string_key_then_ipe_raised(
+        key, expected_error
+):
+    with pytest.raises(InvalidParamException, match=expected_error):
+        Decrypt().validate(params={"key": key})
+
+
+def test_given_verifying_a_valid_mode_no_exceptions_raised():
+    Decrypt().validate(params={"key": "128bitslengthkey", "mode": "CTR"})
+
+
+def test_given_verifying_an_invalid_mode_then_ipe_raised():
+    with pytest.raises(
+            InvalidParamException,
+            match="Parameter mode value GCM is not in range of values",
+    ):
+        Decrypt().validate(params={"key": "128bitslengthkey", "mode": "GCM"})
@@ -29,3 +29,11 @@ def test_given_verifying_an_invalid_length_key_then_ipe_raised():
         match="Invalid input, key must be of length 128, 192 or 256 bits",
     ):
         Encrypt().validate(params={"key": "key"})
+
+
+def test_given_verifying_an_invalid_mode_then_ipe_raised():
+    with pytest.raises(
+        InvalidParamException,
+        match="Parameter mode value GCM is not in range of values",
+    ):
+        Encrypt().validate(params={"key": "128bitslengthkey", "mode": "GCM"})
@@ -37,6 +37,15 @@ def test_given_decrypt_operator_class_then_we_get_the_correct_class():
         assert operator.operator_type() == OperatorType.Deanonymize
 
 
+def test_given_same_operator_twice_then_the_same_instance_is_returned():
+    operators_factory = OperatorsFactory()
+    operator = operators_factory.create_operator_class("decrypt",
+                                                       OperatorType.Deanonymize)
+
+    assert operators_factory.create_operator_class(
+        "decrypt", OperatorType.Deanonymize) is operator
+
+
 def test_given_wrong_name_class_then_we_fail():
     with pytest.raises(InvalidParamException,
                        match="Invalid operator class 'encrypt'."):
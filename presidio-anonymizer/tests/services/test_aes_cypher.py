@@ -1,4 +1,9 @@
+import base64
+from unittest import mock
+
 import pytest
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
 
 from presidio_anonymizer.operators.aes_cipher import AESCipher
 
@@ -26,6 +31,99 @@ def test_given_valid_key_and_text_then_text_encryption_and_decryption_returns_sa
     assert text == decrypted_text
 
 
+@pytest.mark.parametrize(
+    # fmt: off
+    "mode,text",
+    [
+        ("CBC", "text_for_encryption"),
+        ("CTR", "text_for_encryption"),
+        ("CTR", "a text longer than a single AES block, with a Résumé"),
+        ("CTR", ""),
+    ],
+    # fmt: on
+)
+def test_given_mode_then_text_encryption_and_decryption_returns_same_text(
+    mode, text
+):
+    key = b"1111111111111111"
+    encrypted_text = AESCipher.encrypt(key, text, mode)
+
+    assert AESCipher.decrypt(key, encrypted_text, mode) == text
+    assert AESCipher.decrypt_many(key, [encrypted_text] * 2, mode) == [text] * 2
+
+
+def test_given_ctr_mode_then_payload_is_a_96_bits_nonce_and_unpadded_ciphertext():
+    key = b"1111111111111111"
+    text = "text_for_encryption"
+    encrypted_text = AESCipher.encrypt(key, text, "CTR")
+
+    assert len(base64.b64decode(encrypted_text)) == 12 + len(text)
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "key,blocks",
+    [
+        (b'1111111111111111', 1),
+        (b'111111111111111111111111', 8),
+        (b'11111111111111111111111111111111', 17),
+    ],
+    # fmt: on
+)
+def test_given_multi_block_cbc_ciphertext_then_decrypt_returns_plaintext(
+    key, blocks
+):
+    iv = b"0123456789abcdef"
+    text = "abcdefghijklmnop" * blocks
+    ciphertext = AES.new(key, AES.MODE_CBC, iv).encrypt(
+        pad(text.encode("utf-8"), AES.block_size)
+    )
+    encrypted_text = base64.b64encode(iv + ciphertext).decode()
+
+    assert AESCipher.decrypt(key, encrypted_text) == text
+
+
+def test_given_several_texts_then_decrypt_many_returns_all_texts_in_order():
+    key = b"1111111111111111"
+    texts = ["", "short", "a text longer than a single AES block", "面汤"]
+    encrypted_texts = [AESCipher.encrypt(key, text) for text in texts]
+
+    assert AESCipher.decrypt_many(key, encrypted_texts) == texts
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "invalid_text,expected_error",
+    [
+        ("MTExMTExMTExMTExMTExMTEx", "Data must be padded"),  # 18 bytes payload
+        ("", "Data must hold an IV and at least one block"),  # Empty payload
+        ("MTExMTExMTExMTExMTExMQ==", "Data must hold an IV"),  # IV only payload
+    ],
+    # fmt: on
+)
+def test_given_misaligned_ciphertext_then_decrypt_many_raises_value_error(
+    invalid_text, expected_error
+):
+    key = b"1111111111111111"
+    encrypted_texts = [invalid_text, AESCipher.encrypt(key, "text")]
+
+    with pytest.raises(ValueError, match=expected_error):
+        AESCipher.decrypt_many(key, encrypted_texts)
+
+
+def test_given_batch_then_decrypt_many_expands_the_key_once():
+    key = b"1111111111111111"
+    encrypted_texts = [
+        AESCipher.encrypt(key, "first"),
+        AESCipher.encrypt(key, "second"),
+    ]
+
+    with mock.patch.object(AES, "new", wraps=AES.new) as mock_new:
+        AESCipher.decrypt_many(key, encrypted_texts)
+
+    assert mock_new.call_count == 1
+
+
 def test_given_invalid_key_length_then_value_error_raised():
     invalid_length_key = b"1111"
     with pytest.raises(ValueError, match="Incorrect AES key length"):
@@ -2,7 +2,7 @@ from typing import Dict, List
 
 import pytest
 
-from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer import AnonymizerEngine, get_default_engine
 from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.entities.engine import RecognizerResult
 from presidio_anonymizer.entities.engine.operator_config import OperatorConfig
@@ -23,6 +23,13 @@ def test_given_request_anonymizers_return_list():
     assert anon_list == expected_list
 
 
+def test_given_default_engine_requested_twice_then_same_engine_returned():
+    engine = get_default_engine()
+
+    assert isinstance(engine, AnonymizerEngine)
+    assert get_default_engine() is engine
+
+
 def test_given_empty_text_to_engine_then_we_fail():
     engine = AnonymizerEngine()
     analyzer_result = RecognizerResult("SSN", 0, 1, 0.5)